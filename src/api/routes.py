@@ -1,6 +1,7 @@
-from typing import List, Union
+from typing import AsyncIterator, List
 
 from fastapi import APIRouter, Query  # type: ignore
+from fastapi.responses import ORJSONResponse, StreamingResponse  # type: ignore
 
 # insights classes/runners
 from insights.base import InsightResult
@@ -10,28 +11,52 @@ from insights.runner import generate_insights
 from models.portfolio_assets import CryptoAsset, FiatAsset
 
 # portfolio services
-from services.portfolio import get_portfolio
+from services.portfolio import (
+    get_crypto_holdings,
+    get_portfolio,
+    get_staked_holdings,
+    load_portfolio_sources,
+    stream_holdings,
+)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/holdings", response_model=List[CryptoAsset])
+# Holdings are already validated models; skip re-validating them on the way out
+@router.get("/holdings", response_model=None)
 async def fetch_holdings(
     staked_only: bool = Query(False, description="Only return staked assets")
 ):
-    portfolio = await get_portfolio()
     if staked_only:
-        portfolio = [asset for asset in portfolio if asset.is_staked]
-    return portfolio
+        return await get_staked_holdings()
+    return await get_portfolio()
+
+
+async def _to_ndjson(
+    assets: AsyncIterator[CryptoAsset | FiatAsset],
+) -> AsyncIterator[str]:
+    async for asset in assets:
+        yield asset.model_dump_json() + "\n"
+
+
+# Newline-delimited JSON, one asset per line, sent as each asset is enriched.
+# Caches and raw holdings load before the response starts, so upstream
+# failures still return an error status instead of an empty 200 stream.
+@router.get("/holdings/stream", response_model=None)
+async def fetch_holdings_stream():
+    fiat_cache, market_cache, holdings = await load_portfolio_sources()
+    return StreamingResponse(
+        _to_ndjson(stream_holdings(fiat_cache, market_cache, holdings)),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.get("/insights", response_model=List[InsightResult])
 async def get_insights():
-    # Step 1: Get enriched asset holdings
-    holdings: List[Union[CryptoAsset, FiatAsset]] = await get_portfolio()
+    # Step 1: Get enriched crypto holdings (fiat is skipped at the source)
+    crypto_holdings: List[CryptoAsset] = await get_crypto_holdings()
 
-    # Step 2: Run insights (filter to crypto only)
-    crypto_holdings = [a for a in holdings if isinstance(a, CryptoAsset)]
+    # Step 2: Run insights
     insights = generate_insights(crypto_holdings)
 
     # Step 3: Return results
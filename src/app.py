@@ -1,3 +1,5 @@
+import asyncio
+
 from dotenv import load_dotenv  # type: ignore
 
 from fetchers.coinbase import CoinbaseRequestHandler
@@ -5,15 +7,18 @@ from fetchers.coinbase import CoinbaseRequestHandler
 load_dotenv()
 
 
-def main():
+async def main():
     print("Welcome to Midas 🪙\n")
 
     coinbase = CoinbaseRequestHandler()
-    portfolio = coinbase.get_holdings()
+    try:
+        portfolio = await coinbase.get_holdings()
+    finally:
+        await coinbase.aclose()
 
     for asset in portfolio:
         print("\n", asset)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,8 +1,37 @@
-from fetchers.coingecko import MarketDataCache
+import asyncio
+
+import httpx  # type: ignore
+
+from fetchers.coinbase import CoinbaseRequestHandler
+from fetchers.coingecko import CoinGeckoFetcher, MarketDataCache
 from fetchers.frankfurter import FiatRateCache
+from utils.http_client import create_http_client
 
+_http_client: httpx.AsyncClient | None = None
 _fiat_rate_cache: FiatRateCache | None = None
 _market_data_cache: MarketDataCache | None = None
+_coinbase_handler: CoinbaseRequestHandler | None = None
+_coingecko_fetcher: CoinGeckoFetcher | None = None
+
+# Serialize first-time initialization so a cold-start burst triggers one fetch
+_fiat_rate_cache_lock = asyncio.Lock()
+_market_data_cache_lock = asyncio.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Lazily initializes and returns the process-wide pooled HTTP client.
+
+    Coinbase, CoinGecko and Frankfurter requests share this client, so they
+    reuse keep-alive connections instead of opening new ones per request.
+
+    Returns:
+        The shared httpx.AsyncClient instance.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = create_http_client()
+    return _http_client
 
 
 async def get_fiat_rate_cache() -> FiatRateCache:
@@ -11,16 +40,20 @@ async def get_fiat_rate_cache() -> FiatRateCache:
 
     This ensures that fiat-to-USD exchange rates are loaded only once per runtime,
     and automatically refreshed if the cache has expired (based on TTL).
+    Concurrent first calls wait on a lock so only one of them initializes the cache.
 
     Returns:
         An initialized FiatRateCache instance with up-to-date exchange rates.
     """
     global _fiat_rate_cache
     if _fiat_rate_cache is None:
-        _fiat_rate_cache = FiatRateCache()
-        await _fiat_rate_cache.initialize()
-    else:
-        await _fiat_rate_cache.maybe_refresh()
+        async with _fiat_rate_cache_lock:
+            if _fiat_rate_cache is None:
+                cache = FiatRateCache(client=get_http_client())
+                await cache.initialize()
+                _fiat_rate_cache = cache
+        return _fiat_rate_cache
+    await _fiat_rate_cache.maybe_refresh()
     return _fiat_rate_cache
 
 
@@ -30,14 +63,76 @@ async def get_market_data_cache() -> MarketDataCache:
 
     Ensures that CoinGecko market data (symbol-to-ID mapping and top-N asset metadata)
     is loaded only once per runtime, with optional TTL-based refresh.
+    Concurrent first calls wait on a lock so only one of them initializes the cache.
 
     Returns:
         An initialized MarketDataCache instance with enriched CoinGecko data.
     """
     global _market_data_cache
     if _market_data_cache is None:
-        _market_data_cache = MarketDataCache()
-        await _market_data_cache.initialize()
-    else:
-        await _market_data_cache.maybe_refresh()
+        async with _market_data_cache_lock:
+            if _market_data_cache is None:
+                cache = MarketDataCache(fetcher=get_coingecko_fetcher())
+                await cache.initialize()
+                _market_data_cache = cache
+        return _market_data_cache
+    await _market_data_cache.maybe_refresh()
     return _market_data_cache
+
+
+async def get_coinbase_handler() -> CoinbaseRequestHandler:
+    """
+    Lazily initializes and returns a globally shared CoinbaseRequestHandler.
+
+    Sharing the handler lets every request reuse its JWT and price caches,
+    and it borrows the process-wide pooled HTTP client, so Coinbase calls
+    reuse keep-alive connections instead of opening new ones each time.
+
+    Returns:
+        The process-wide CoinbaseRequestHandler instance.
+    """
+    global _coinbase_handler
+    if _coinbase_handler is None:
+        _coinbase_handler = CoinbaseRequestHandler(client=get_http_client())
+    return _coinbase_handler
+
+
+def get_coingecko_fetcher() -> CoinGeckoFetcher:
+    """
+    Lazily initializes and returns the process-wide CoinGeckoFetcher.
+
+    Every CoinGecko consumer goes through this fetcher, so they all share one
+    pooled HTTP client and its conditional-request (ETag) state.
+
+    Returns:
+        The shared CoinGeckoFetcher instance.
+    """
+    global _coingecko_fetcher
+    if _coingecko_fetcher is None:
+        _coingecko_fetcher = CoinGeckoFetcher(client=get_http_client())
+    return _coingecko_fetcher
+
+
+async def close_clients() -> None:
+    """
+    Closes any HTTP clients held by the shared dependencies.
+    Intended to be called once on application shutdown.
+    """
+    global _coinbase_handler, _market_data_cache, _coingecko_fetcher
+    global _fiat_rate_cache, _http_client
+    if _coinbase_handler is not None:
+        await _coinbase_handler.aclose()
+        _coinbase_handler = None
+    if _market_data_cache is not None:
+        await _market_data_cache.aclose()
+        _market_data_cache = None
+    if _coingecko_fetcher is not None:
+        await _coingecko_fetcher.aclose()
+        _coingecko_fetcher = None
+    if _fiat_rate_cache is not None:
+        await _fiat_rate_cache.aclose()
+        _fiat_rate_cache = None
+    # fetchers only borrow the shared client, so close it last
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
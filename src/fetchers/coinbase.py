@@ -1,12 +1,32 @@
 import asyncio
 import os
-from typing import Any, Dict, List
+import time
+from functools import cached_property
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import httpx  # type: ignore
+import orjson  # type: ignore
 from coinbase import jwt_generator
 
+import logging
+from utils.http_client import HTTPClientOwner
 
-class CoinbaseRequestHandler:
+logger = logging.getLogger(__name__)
+
+# Headers shared by every authenticated request; Authorization is added per call
+_BASE_HEADERS = {"Content-Type": "application/json"}
+
+# Batched price source tried before the per-symbol spot endpoint: takes the
+# portfolio's symbols and returns USD prices for the ones it could price
+PriceLookup = Callable[[List[str]], Awaitable[Dict[str, float]]]
+
+# Coinbase calls sit on the request path, so they use a tighter timeout than
+# the pooled client's default
+REQUEST_TIMEOUT_SECONDS = 5.0
+
+
+class CoinbaseRequestHandler(HTTPClientOwner):
     """
     Handles authenticated Coinbase API requests to fetch account balances and
     spot prices for crypto assets.
@@ -21,7 +41,13 @@ class CoinbaseRequestHandler:
         - COINBASE_API_SECRET_PATH (path to secret for signing requests)
     """
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: Optional shared HTTP client. If omitted, one is created on
+                first use and closed by `aclose()`.
+        """
+        super().__init__(client)
         # Authentication config
         self.api_key = os.getenv("COINBASE_API_KEY")
         self.key_path = os.getenv("COINBASE_API_SECRET_PATH")
@@ -29,29 +55,72 @@ class CoinbaseRequestHandler:
         # API endpoints
         self.base_url = "https://api.coinbase.com"
         self.accounts_api = "/api/v2/accounts"
-        self.assets_api = lambda symbol: f"/v2/prices/{symbol}-USD/spot"
 
-        # Header constructor for authenticated requests
-        self.headers = lambda token: {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+        # Short-lived spot price cache: symbol -> (price, expires_at)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self._price_ttl = 15.0
+        self._price_locks: Dict[str, asyncio.Lock] = {}
+
+        # Caps in-flight spot price requests to stay under Coinbase rate limits
+        self._price_sem = asyncio.Semaphore(8)
 
-    @property
+        # Signed JWT cache: (method, path) -> (token, expires_at).
+        # Coinbase JWTs are valid for ~120s, so reuse them for slightly less.
+        self._jwt_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._jwt_ttl = 100.0
+
+    @staticmethod
+    def _price_path(symbol: str) -> str:
+        """
+        Returns the spot price endpoint path for a given asset symbol.
+        """
+        return f"/v2/prices/{symbol}-USD/spot"
+
+    @staticmethod
+    def _auth_headers(token: str) -> Dict[str, str]:
+        """
+        Builds the headers for an authenticated request with the given JWT.
+        """
+        return {**_BASE_HEADERS, "Authorization": f"Bearer {token}"}
+
+    async def _get(self, path: str, headers: Dict[str, str]) -> httpx.Response:
+        """
+        Issues a GET for a Coinbase API path. The client may be shared with
+        other APIs, so the base URL and timeout are applied per request.
+        """
+        client = self._get_client()
+        return await client.get(
+            self.base_url + path, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS
+        )
+
+    @cached_property
     def api_secret(self) -> str:
         """
         Reads the API secret from a file path defined in COINBASE_API_SECRET_PATH.
 
+        The file is read once and cached on the handler; use
+        `reload_api_secret()` to pick up a rotated key.
+
         Returns:
             The API secret as a string.
         """
         with open(self.key_path, "r") as f:
             return f.read()
 
+    def reload_api_secret(self) -> None:
+        """
+        Drops the cached API secret so it is re-read from disk on next use.
+        """
+        self.__dict__.pop("api_secret", None)
+        self._jwt_cache.clear()
+
     def build_jwt_for(self, path: str, method: str = "GET") -> str:
         """
         Generates a JWT token for a specific Coinbase API request.
 
+        Tokens are memoized per (method, path) and reused until shortly
+        before they expire, avoiding a fresh signature on every request.
+
         Args:
             path: The request path (e.g., "/api/v2/accounts").
             method: HTTP method (default "GET").
@@ -59,8 +128,16 @@ class CoinbaseRequestHandler:
         Returns:
             A signed JWT string for authentication.
         """
+        key = (method, path)
+        now = time.monotonic()
+        cached = self._jwt_cache.get(key)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
         jwt_uri = jwt_generator.format_jwt_uri(method, path)
-        return jwt_generator.build_rest_jwt(jwt_uri, self.api_key, self.api_secret)
+        token = jwt_generator.build_rest_jwt(jwt_uri, self.api_key, self.api_secret)
+        self._jwt_cache[key] = (token, now + self._jwt_ttl)
+        return token
 
     async def _get_all_accounts(self) -> List[Dict[str, Any]]:
         """
@@ -72,85 +149,124 @@ class CoinbaseRequestHandler:
         Raises:
             Exception if the API call fails.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.base_url + self.accounts_api,
-                headers=self.headers(self.build_jwt_for(self.accounts_api)),
-            )
+        response = await self._get(
+            self.accounts_api,
+            headers=self._auth_headers(self.build_jwt_for(self.accounts_api)),
+        )
 
-            if response.status_code != 200:
-                raise Exception(
-                    f"Failed to fetch accounts: {response.status_code} {response.text}"
-                )
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to fetch accounts: {response.status_code} {response.text}"
+            )
 
-            return response.json().get("data", [])
+        return orjson.loads(response.content).get("data", [])
 
     async def get_asset_price(self, symbol: str) -> float:
         """
         Fetches the current USD spot price for a given crypto asset.
 
+        Prices are cached per symbol for a short TTL, and concurrent lookups
+        for the same symbol share a single network call.
+
         Args:
             symbol: Asset symbol (e.g., "ETH", "BTC").
 
         Returns:
             The asset's USD spot price as a float, or 0.0 if unavailable.
         """
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    self.base_url + self.assets_api(symbol),
-                    headers=self.headers(self.build_jwt_for(self.assets_api(symbol))),
-                )
-                return float(response.json()["data"]["amount"])
-        except (httpx.HTTPError, KeyError, TypeError, ValueError):
-            print(f"Could not extract price for {symbol}")
-            return 0.0
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        lock = self._price_locks.setdefault(symbol, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have filled the cache while we waited
+            cached = self._price_cache.get(symbol)
+            if cached is not None and time.monotonic() < cached[1]:
+                return cached[0]
+
+            path = self._price_path(symbol)
+            try:
+                async with self._price_sem:
+                    response = await self._get(
+                        path, self._auth_headers(self.build_jwt_for(path))
+                    )
+                price = float(orjson.loads(response.content)["data"]["amount"])
+            except (httpx.HTTPError, KeyError, TypeError, ValueError):
+                logger.warning("Could not extract price for %s", symbol)
+                return 0.0
+
+            self._price_cache[symbol] = (price, time.monotonic() + self._price_ttl)
+            return price
 
     async def _construct_portfolio(
-        self, accounts: List[Dict[str, Any]]
+        self,
+        accounts: List[Dict[str, Any]],
+        price_lookup: Optional[PriceLookup] = None,
     ) -> List[Dict[str, Any]]:
         """
         Converts raw account records into a structured portfolio with price enrichment.
 
         Args:
             accounts: A list of account dicts from the Coinbase API.
+            price_lookup: Optional batched price source called once with every
+                held symbol (e.g., a live CoinGecko `/simple/price` request). The
+                Coinbase spot endpoint is only queried for symbols it cannot price.
 
         Returns:
             A sorted list of enriched asset dictionaries, descending by USD value.
         """
-
-        async def process_account(acct):
+        # Pass 1: keep only funded accounts
+        entries = []
+        for acct in accounts:
             balance = float(acct["balance"]["amount"])
-            symbol = acct["currency"]["code"]
-            if balance == 0:
-                return None
+            if balance != 0:
+                entries.append((acct["currency"]["code"], balance, acct))
+
+        # Pass 2: resolve prices with one batched lookup, falling back to Coinbase spot
+        symbols = list({symbol for symbol, _, _ in entries})
+        prices: Dict[str, float] = {}
+        if price_lookup is not None and symbols:
+            prices.update(await price_lookup(symbols))
 
-            price = await self.get_asset_price(symbol)
+        missing = [symbol for symbol in symbols if symbol not in prices]
+        fetched = await asyncio.gather(*(self.get_asset_price(s) for s in missing))
+        prices.update(zip(missing, fetched))
+
+        # Pass 3: build the portfolio records
+        results = []
+        for symbol, balance, acct in entries:
+            price = prices[symbol]
             is_staked = acct["name"].lower().startswith("staked")
-            return {
-                "id": acct["id"],
-                "name": acct["currency"]["name"],
-                "symbol": symbol,
-                "balance": balance,
-                "usd_price": price,
-                "usd_value": balance * price,
-                "is_staked": is_staked,
-                "apy": (
-                    float(acct["currency"].get("rewards", {}).get("apy", 0))
-                    if is_staked
-                    else None
-                ),
-            }
-
-        results = await asyncio.gather(*(process_account(acct) for acct in accounts))
-        return sorted(
-            [r for r in results if r], key=lambda x: x["usd_value"], reverse=True
-        )
+            results.append(
+                {
+                    "id": acct["id"],
+                    "name": acct["currency"]["name"],
+                    "symbol": symbol,
+                    "balance": balance,
+                    "usd_price": price,
+                    "usd_value": balance * price,
+                    "is_staked": is_staked,
+                    "apy": (
+                        float(acct["currency"].get("rewards", {}).get("apy", 0))
+                        if is_staked
+                        else None
+                    ),
+                }
+            )
+
+        return sorted(results, key=itemgetter("usd_value"), reverse=True)
 
-    async def get_holdings(self) -> List[Dict[str, Any]]:
+    async def get_holdings(
+        self, price_lookup: Optional[PriceLookup] = None
+    ) -> List[Dict[str, Any]]:
         """
         Public method to retrieve the user's full portfolio from Coinbase.
 
+        Args:
+            price_lookup: Optional batched price source for every held symbol,
+                used before falling back to the per-symbol Coinbase spot endpoint.
+
         Returns:
             A list of enriched asset holdings, each with:
               - id, name, symbol
@@ -159,4 +275,4 @@ class CoinbaseRequestHandler:
               - staking status and APY (if applicable)
         """
         accounts = await self._get_all_accounts()
-        return await self._construct_portfolio(accounts)
+        return await self._construct_portfolio(accounts, price_lookup)
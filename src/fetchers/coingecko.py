@@ -1,13 +1,57 @@
+import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
 
 import httpx  # type: ignore
+import orjson  # type: ignore
+from pydantic import TypeAdapter  # type: ignore
 
+import logging
 from models.market_data import MarketData
-
-
-class CoinGeckoBaseModel:
+from utils.http_client import HTTPClientOwner
+from utils.refresh import refresh_ahead
+
+logger = logging.getLogger(__name__)
+
+# Snapshot of the live cache, rewritten after every full refresh so a restart
+# within the TTL can skip the network entirely
+SNAPSHOT_PATH = ".midas_cache.json"
+
+# Symbols CoinGecko does not know (delisted tokens, typos) are remembered for a
+# day so repeat lookups don't spend API quota; the table is bounded to keep
+# memory flat. Cached symbols are checked first, so a coin that enters the
+# top N is still picked up by the next full refresh.
+NEGATIVE_TTL_SECONDS = 24 * 60 * 60.0
+MAX_NEGATIVE_ENTRIES = 1024
+
+# Symbols resolved through the fallback are re-fetched with each full refresh
+# (one batched request) for this long, so long-tail holdings stay cached
+# instead of costing a fallback on the request path every TTL
+FALLBACK_TTL_SECONDS = 3600.0
+MAX_FALLBACK_ENTRIES = 512
+
+# Retry policy for transient CoinGecko failures (rate limits, 5xx, network errors).
+# Background refreshes get the full budget; calls made while a user request
+# waits (e.g., fallback lookups) get REQUEST_PATH_ATTEMPTS so an outage fails fast.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_ATTEMPTS = 5
+REQUEST_PATH_ATTEMPTS = 1
+MAX_BACKOFF_SECONDS = 30.0
+
+# Background refreshes pause briefly once fewer than LOW_QUOTA_FRACTION of the
+# rate-limit window's calls remain, instead of running into 429s. Request-path
+# calls never pause, since a user is waiting on them.
+LOW_QUOTA_FRACTION = 0.1
+LOW_QUOTA_PAUSE_SECONDS = 1.0
+
+# Validates a whole `/coins/markets` page from raw JSON bytes in one call
+_MARKET_DATA_LIST = TypeAdapter(List[MarketData])
+
+
+class CoinGeckoBaseModel(HTTPClientOwner):
     """
     Base class for shared CoinGecko configuration, including API key handling,
     base URL, and request headers.
@@ -16,16 +60,24 @@ class CoinGeckoBaseModel:
         api_key (str): API key loaded from environment variable.
         base_url (str): Base URL for the CoinGecko API.
         coins_market_api (str): Endpoint for querying market data.
+        simple_price_api (str): Endpoint for querying current prices by ID.
         headers (Dict[str, str]): Common headers used for API requests.
         page_limit (int): Default pagination size for market requests.
         num_pages (int): Default number of pages to fetch for market requests.
     """
 
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: Optional shared HTTP client. If omitted, one is created on
+                first use and closed by `aclose()`.
+        """
+        super().__init__(client)
         # vars - apis
         self.api_key = os.getenv("COINGECKO_API_KEY")
         self.base_url = "https://api.coingecko.com/api/v3"
         self.coins_market_api = "/coins/markets"
+        self.simple_price_api = "/simple/price"
         self.headers = {
             "accept": "application/json",
             "x-cg-demo-api-key": f"{self.api_key}",
@@ -33,6 +85,96 @@ class CoinGeckoBaseModel:
         self.page_limit = 250
         self.num_pages = 3
 
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+        """
+        Returns how long to wait before the next attempt: the server's
+        `Retry-After` when given in seconds, otherwise exponential backoff
+        with full jitter. Both are capped at MAX_BACKOFF_SECONDS.
+        """
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return min(max(float(retry_after), 0.0), MAX_BACKOFF_SECONDS)
+                except ValueError:
+                    pass  # HTTP-date form; fall back to backoff
+        return random.uniform(0, min(MAX_BACKOFF_SECONDS, 2**attempt))
+
+    @staticmethod
+    async def _throttle_if_low_quota(response: httpx.Response) -> None:
+        """
+        Sleeps for LOW_QUOTA_PAUSE_SECONDS when the response's rate-limit
+        headers show the remaining quota has dropped below LOW_QUOTA_FRACTION.
+        """
+        remaining = response.headers.get("x-ratelimit-remaining")
+        limit = response.headers.get("x-ratelimit-limit")
+        if not remaining or not limit:
+            return
+        try:
+            low = int(remaining) < int(limit) * LOW_QUOTA_FRACTION
+        except ValueError:
+            return
+        if low:
+            logger.info(
+                "CoinGecko quota low (%s/%s remaining); pausing %.1fs",
+                remaining,
+                limit,
+                LOW_QUOTA_PAUSE_SECONDS,
+            )
+            await asyncio.sleep(LOW_QUOTA_PAUSE_SECONDS)
+
+    async def _get(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_attempts: int = MAX_ATTEMPTS,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Issues a GET for a CoinGecko API path through the pooled client, retrying
+        network errors and rate-limit/5xx responses up to `max_attempts` times.
+        Background calls (more than REQUEST_PATH_ATTEMPTS) also pause when the
+        rate-limit quota runs low.
+
+        The client may be shared with other APIs, so the base URL and the
+        CoinGecko headers are applied per request.
+
+        Returns:
+            The first non-retryable response, or the last response once
+            attempts are exhausted.
+
+        Raises:
+            httpx.HTTPError if the final attempt fails at the transport level.
+        """
+        client = self._get_client()
+        url = self.base_url + path
+        headers = {**self.headers, **headers} if headers else self.headers
+        for attempt in range(1, max_attempts + 1):
+            response = None
+            try:
+                response = await client.get(url, headers=headers, **kwargs)
+                if response.status_code not in RETRY_STATUSES:
+                    if max_attempts > REQUEST_PATH_ATTEMPTS:
+                        await self._throttle_if_low_quota(response)
+                    return response
+            except httpx.HTTPError:
+                if attempt == max_attempts:
+                    raise
+            if attempt == max_attempts:
+                return response
+
+            delay = self._retry_delay(attempt, response)
+            logger.info(
+                "Retrying CoinGecko %s in %.1fs (attempt %d/%d, status %s)",
+                path,
+                delay,
+                attempt,
+                max_attempts,
+                response.status_code if response is not None else "error",
+            )
+            await asyncio.sleep(delay)
+
 
 class CoinGeckoFetcher(CoinGeckoBaseModel):
     """
@@ -43,135 +185,256 @@ class CoinGeckoFetcher(CoinGeckoBaseModel):
         CoinGeckoBaseModel: Provides shared base URL, headers, and config values.
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
         # Timeframes to extract price change percentages for
-        self.timeframes = ["7d", "14d", "30d", "200d", "1y"]
-
-        # Query params for fetching specific symbols (by comma-separated symbol string)
-        self.query_params_specific_symbols = lambda symbols: {
-            "vs_currency": "usd",
-            "order": "market_cap_desc",  # to ensure that we grab the most relevant
-            "symbols": symbols,
-            "price_change_percentage": ",".join(self.timeframes),
-        }
-        # Query params for fetching paginated top assets (e.g., top 750)
-        self.query_params_top_assets = lambda page_num: {
-            "vs_currency": "usd",
-            "order": "market_cap_desc",
-            "per_page": self.page_limit,
-            "page": page_num,
-            "price_change_percentage": ",".join(self.timeframes),
-        }
+        self.timeframes = ("7d", "14d", "30d", "200d", "1y")
+        price_change_percentage = ",".join(self.timeframes)
+
+        # Query params are built (and URL-encoded) once and reused per request.
+        # Specific-symbol lookups add `symbols` to the base params per call.
+        self._symbol_params = httpx.QueryParams(
+            {
+                "vs_currency": "usd",
+                "order": "market_cap_desc",  # to ensure that we grab the most relevant
+                "per_page": self.page_limit,  # room for several coins per symbol
+                "price_change_percentage": price_change_percentage,
+            }
+        )
+        # One set of params per paginated top-asset page (e.g., top 750)
+        self._top_assets_params = [
+            httpx.QueryParams(
+                {
+                    "vs_currency": "usd",
+                    "order": "market_cap_desc",
+                    "per_page": self.page_limit,
+                    "page": page,
+                    "price_change_percentage": price_change_percentage,
+                }
+            )
+            for page in range(1, self.num_pages + 1)
+        ]
 
-    def _extract_clean_price_changes(self, coin: dict) -> dict:
+        # Conditional-request state per page index: last validators and parsed coins
+        self._etags: Dict[int, Optional[str]] = {}
+        self._last_modified: Dict[int, Optional[str]] = {}
+        self._page_cache: Dict[int, List[MarketData]] = {}
+
+    def _parse_coins(self, content: bytes) -> List[MarketData]:
         """
-        Extracts simplified price change fields from CoinGecko's
-        `_in_currency` fields and renames them to match internal model format.
+        Decodes a `/coins/markets` response body straight into MarketData
+        objects, skipping entries without a symbol or ID.
 
-        Example: price_change_percentage_7d_in_currency → price_change_percentage_7d
+        Field renames (e.g., `price_change_percentage_7d_in_currency`) are
+        handled by the model's validation aliases during the same pass.
         """
-        return {
-            f"price_change_percentage_{t}": coin.get(
-                f"price_change_percentage_{t}_in_currency"
+        return [
+            market_data
+            for market_data in _MARKET_DATA_LIST.validate_json(content)
+            if market_data.symbol and market_data.id
+        ]
+
+    def _conditional_headers(self, page: int) -> Optional[Dict[str, str]]:
+        """
+        Returns `If-None-Match` / `If-Modified-Since` headers for a page we hold
+        validators and data for. Servers prefer the ETag when both are sent.
+        """
+        if page not in self._page_cache:
+            return None
+        headers = {}
+        etag = self._etags.get(page)
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = self._last_modified.get(page)
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers or None
+
+    @staticmethod
+    def _merge_page(
+        coins: List[MarketData],
+        symbol_to_id: Dict[str, str],
+        id_to_market_data: Dict[str, MarketData],
+    ) -> None:
+        """
+        Adds a page of coins to the mappings; symbols already mapped by an
+        earlier (higher market cap) page are kept.
+        """
+        for market_data in coins:
+            # interned keys make cache lookups pointer comparisons
+            symbol = sys.intern(market_data.symbol.lower())
+            # setdefault returns our own id object only if it was just inserted
+            if symbol_to_id.setdefault(symbol, market_data.id) is market_data.id:
+                id_to_market_data[market_data.id] = market_data
+
+    async def _fetch_page(
+        self, page: int, params: httpx.QueryParams, max_attempts: int = MAX_ATTEMPTS
+    ) -> List[MarketData]:
+        """
+        Fetches and parses a single top-assets page.
+
+        Each page is parsed as soon as its own body arrives, so decoding one
+        page overlaps with the other pages still downloading.
+
+        Raises:
+            Exception if the page cannot be fetched.
+        """
+        response = await self._get(
+            self.coins_market_api,
+            params=params,
+            headers=self._conditional_headers(page),
+            max_attempts=max_attempts,
+        )
+        if response.status_code == 304:
+            return self._page_cache[page]
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to fetch list of coins + symbols: {response.status_code} {response.text}"
             )
-            for t in self.timeframes
-        }
 
-    async def get_top_assets(self) -> Tuple[Dict[str, str], Dict[str, dict]]:
+        coins = self._parse_coins(response.content)
+        self._page_cache[page] = coins
+        self._etags[page] = response.headers.get("etag")
+        self._last_modified[page] = response.headers.get("last-modified")
+        return coins
+
+    async def get_top_assets(
+        self, max_attempts: int = MAX_ATTEMPTS
+    ) -> Tuple[Dict[str, str], Dict[str, MarketData]]:
         """
         Fetches multiple pages of top coins by market cap using the `/coins/markets` endpoint.
         Returns both a symbol → CoinGecko ID mapping, and a CoinGecko ID → enriched market data mapping.
 
+        Pages are requested conditionally with their last ETag and Last-Modified;
+        a `304 Not Modified` reuses the previously parsed page instead of
+        decoding it again.
+
+        Args:
+            max_attempts: Retry budget per page; pass REQUEST_PATH_ATTEMPTS when
+                a user request is waiting on the result.
+
         Returns:
             - symbol_to_id: Maps lowercase symbols (e.g., 'eth') to CoinGecko IDs (e.g., 'ethereum')
             - id_to_market_data: Maps CoinGecko IDs to `MarketData` objects with price changes and metadata
         """
         try:
-            async with httpx.AsyncClient() as client:
-                # for now, limit coins to the top 500 by market cap
-                symbol_to_id = {}
-                id_to_market_data = {}
-                for page in range(1, 4):
-                    response = await client.get(
-                        self.base_url + self.coins_market_api,
-                        headers=self.headers,
-                        params=self.query_params_top_assets(page),
-                    )
-
-                    if response.status_code != 200:
-                        raise Exception(
-                            f"Failed to fetch list of coins + symbols: {response.status_code} {response.text}"
-                        )
-
-                    for coin in response.json():
-                        symbol = coin.get("symbol", "").lower()
-                        coin_id = coin.get("id")
-                        if symbol and coin_id and symbol not in symbol_to_id:
-                            symbol_to_id[symbol] = coin_id
-                            cleaned_data = {
-                                **coin,
-                                **self._extract_clean_price_changes(coin),
-                            }
-                            id_to_market_data[coin_id] = MarketData(**cleaned_data)
+            symbol_to_id = {}
+            id_to_market_data = {}
+
+            # fetch and parse every page at once; the pages are independent, and
+            # collecting exceptions lets every page settle before we bail
+            pages = await asyncio.gather(
+                *(
+                    self._fetch_page(page, params, max_attempts)
+                    for page, params in enumerate(self._top_assets_params)
+                ),
+                return_exceptions=True,
+            )
+
+            # merge in page order so higher market cap coins win symbol clashes;
+            # any failed page aborts the refresh so a partial list never
+            # replaces the current cache
+            for coins in pages:
+                if isinstance(coins, BaseException):
+                    raise coins
+                self._merge_page(coins, symbol_to_id, id_to_market_data)
 
             return (symbol_to_id, id_to_market_data)
 
         except Exception as e:
-            print(
-                f"Failed to fetch top {self.page_limit * self.num_pages} with error: {e}"
+            logger.warning(
+                "Failed to fetch top %d with error: %s",
+                self.page_limit * self.num_pages,
+                e,
             )
             return ({}, {})
 
-    async def get_coin_market_data_by_symbol(self, symbols: List[str]) -> bool:
+    async def get_simple_prices(self, coin_ids: Set[str]) -> Optional[Dict[str, float]]:
+        """
+        Fetches current USD prices for several CoinGecko IDs in a single
+        `/simple/price` request.
+
+        The call is made while a user request waits, so it is not retried.
+
+        Args:
+            coin_ids: CoinGecko IDs to price (e.g., {'bitcoin', 'ethereum'}).
+
+        Returns:
+            A mapping of CoinGecko ID → USD price for every ID priced, or None
+            if the fetch fails.
+        """
+        id_str = ",".join(sorted(coin_ids))
+        try:
+            response = await self._get(
+                self.simple_price_api,
+                params={"ids": id_str, "vs_currencies": "usd"},
+                max_attempts=REQUEST_PATH_ATTEMPTS,
+            )
+            if response.status_code != 200:
+                raise Exception(
+                    f"Failed to fetch prices: {response.status_code} {response.text}"
+                )
+            return {
+                coin_id: float(quote["usd"])
+                for coin_id, quote in orjson.loads(response.content).items()
+                if quote.get("usd") is not None
+            }
+        except Exception as e:
+            logger.warning("Failed to fetch prices for '%s' with error: %s", id_str, e)
+            return None
+
+    async def get_coin_market_data_by_symbol(
+        self, symbols: List[str], max_attempts: int = MAX_ATTEMPTS
+    ) -> Optional[Dict[str, MarketData]]:
         """
         Fetches market data for one or more specific symbols using the `/coins/markets` endpoint.
         Intended to be used for fallback enrichment of non-top-N assets.
 
+        All symbols are resolved in a single request; when several coins share a
+        symbol, the one with the highest market cap wins.
+
         Args:
-            symbols: A list of lowercase symbol strings (e.g., ['doge'])
+            symbols: A list of lowercase symbol strings (e.g., ['doge', 'shib'])
+            max_attempts: Retry budget; pass REQUEST_PATH_ATTEMPTS when a user
+                request is waiting on the result.
 
         Returns:
-            - CoinGecko ID for the fetched coin (if found)
-            - Enriched MarketData object with price and change percentages
-
-            Returns (None, None) if fetch fails or data is not available.
+            A mapping of lowercase symbol → enriched MarketData for every symbol found.
+            Returns None if the fetch fails, so callers can tell a failed
+            request apart from symbols CoinGecko does not list.
         """
+        # join symbols together in comma-separated string
+        symbol_str = ",".join(symbols)
         try:
-            async with httpx.AsyncClient() as client:
-                # join symbols together in comma-separated string
-                symbol_str = ",".join(symbols)
-                response = await client.get(
-                    self.base_url + self.coins_market_api,
-                    headers=self.headers,
-                    params=self.query_params_specific_symbols(symbol_str),
-                )
+            response = await self._get(
+                self.coins_market_api,
+                params=self._symbol_params.set("symbols", symbol_str),
+                max_attempts=max_attempts,
+            )
 
-                if response.status_code != 200:
-                    raise Exception(
-                        f"Failed to fetch list of coins + symbols: {response.status_code} {response.text}"
-                    )
-
-                coin = response.json()[
-                    0
-                ]  # for now, assume this is only called for one coin at a time
-                coin_id = coin.get("id")
-                cleaned_data = {
-                    **coin,
-                    **self._extract_clean_price_changes(coin),
-                }
-                coin_market_data = MarketData(**cleaned_data)
+            if response.status_code != 200:
+                raise Exception(
+                    f"Failed to fetch list of coins + symbols: {response.status_code} {response.text}"
+                )
 
-                return coin_id, coin_market_data
+            # results are ordered by market cap, so keep the first coin per symbol
+            symbol_to_market_data: Dict[str, MarketData] = {}
+            for market_data in self._parse_coins(response.content):
+                symbol_to_market_data.setdefault(
+                    market_data.symbol.lower(), market_data
+                )
+            return symbol_to_market_data
 
         except Exception as e:
-            print(
-                f"Failed to fetch data for coins with symbols '{symbol_str}' with error: {e}"
+            logger.warning(
+                "Failed to fetch data for coins with symbols '%s' with error: %s",
+                symbol_str,
+                e,
             )
-            return (None, {})
+            return None
 
 
-class MarketDataCache(CoinGeckoBaseModel):
+class MarketDataCache:
     """
     In-memory cache for mapping asset symbols (e.g., 'btc') to CoinGecko IDs
     (e.g., 'bitcoin'), and storing enriched market data for those assets.
@@ -182,11 +445,21 @@ class MarketDataCache(CoinGeckoBaseModel):
     Attributes:
         symbol_to_id (Dict[str, str]): Maps lowercase symbols to CoinGecko IDs.
         id_to_market_data (Dict[str, MarketData]): Cached market data for each asset ID.
+        symbol_to_market_data (Dict[str, MarketData]): Derived view joining the
+            two maps above, so a symbol resolves to its market data in one lookup.
         ttl_seconds (int): Time-to-live for the cache before triggering refresh.
+
+    All CoinGecko traffic goes through a single CoinGeckoFetcher, which may be
+    shared with other callers so the process keeps one pooled HTTP client.
     """
 
     def __init__(
-        self, ttl_seconds: int = 3600, store_backend=None, market_store_backend=None
+        self,
+        ttl_seconds: int = 3600,
+        store_backend=None,
+        market_store_backend=None,
+        snapshot_path: Optional[str] = SNAPSHOT_PATH,
+        fetcher: Optional[CoinGeckoFetcher] = None,
     ):
         """
         Initializes the MarketDataCache instance.
@@ -195,37 +468,211 @@ class MarketDataCache(CoinGeckoBaseModel):
             ttl_seconds: Duration (in seconds) before cached data is considered stale.
             store_backend: Optional external dict to inject for symbol-to-ID mapping.
             market_store_backend: Optional external dict to inject for market data.
+            snapshot_path: Optional file the cache is persisted to after each
+                full refresh and restored from on startup; None disables it.
+            fetcher: Optional shared CoinGeckoFetcher. If omitted, the cache
+                creates and owns its own, closing it in `aclose()`.
         """
-        super().__init__()
         # cache dict implementation
         self.symbol_to_id: Dict[str, str] = store_backend or {}
         self.id_to_market_data: Dict[str, MarketData] = market_store_backend or {}
-        self._last_refreshed: Optional[datetime] = None
+        self.symbol_to_market_data = self._build_market_data_view(
+            self.symbol_to_id, self.id_to_market_data
+        )
+        # monotonic deadline after which the cache is stale; 0.0 means never
+        # refreshed. Precomputed so the per-request check is one comparison.
+        self._expires_at = 0.0
         self.ttl_seconds = ttl_seconds
+        self.snapshot_path = snapshot_path
+        # The in-flight refresh, shared by every caller so only one runs at a time
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_loop_task: Optional[asyncio.Task] = None
+
+        # In-flight fallback lookups, keyed by symbol
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Symbols CoinGecko reported as unknown: symbol -> monotonic expiry
+        self._negative: Dict[str, float] = {}
 
-        # Internal fetcher that wraps CoinGecko API calls
-        self._fetcher = CoinGeckoFetcher()
+        # Symbols resolved through the fallback: symbol -> monotonic expiry
+        self._fallback_symbols: Dict[str, float] = {}
+
+        # Fetcher that wraps CoinGecko API calls; only closed here if we created it
+        self._owns_fetcher = fetcher is None
+        self._fetcher = fetcher or CoinGeckoFetcher()
+
+    @property
+    def top_n(self) -> int:
+        """
+        Number of top assets by market cap covered by a full refresh.
+        """
+        return self._fetcher.page_limit * self._fetcher.num_pages
 
     async def initialize(self):
         """
         Initializes the cache by refreshing symbol-to-ID mappings and top asset metadata.
         Intended to be called once at application startup.
+
+        A snapshot saved within the TTL is served as-is with no network call.
+        Otherwise an older snapshot is loaded immediately and the network
+        refresh runs in the background, so the cache can serve requests right
+        away.
+
+        Afterwards a background task keeps refreshing the cache ahead of expiry.
+        """
+        saved_at = self._load_snapshot(self.snapshot_path)
+        if saved_at is not None and time.time() - saved_at < self.ttl_seconds:
+            # the snapshot expires on its own schedule, not a fresh TTL
+            age = max(time.time() - saved_at, 0.0)
+            self._expires_at = time.monotonic() + self.ttl_seconds - age
+        elif saved_at is not None:
+            self._start_refresh()
+        else:
+            await asyncio.shield(self._start_refresh())
+        self._start_refresh_loop()
+
+    def _start_refresh_loop(self) -> None:
+        """
+        Starts the background task that refreshes the cache ahead of expiry.
+        """
+        if self._refresh_loop_task is None or self._refresh_loop_task.done():
+            self._refresh_loop_task = asyncio.create_task(
+                refresh_ahead(
+                    self.ttl_seconds, lambda: self._expires_at, self._start_refresh
+                )
+            )
+
+    def _load_snapshot(self, path: Optional[str]) -> Optional[float]:
+        """
+        Loads a cache snapshot with `symbol_to_id` and `id_to_market_data` keys.
+
+        Args:
+            path: Snapshot file to read; missing or unreadable files are ignored.
+
+        Returns:
+            Optional[float]: The snapshot's wall-clock save time (0.0 if it has
+            none), or None if nothing was loaded.
+        """
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                snapshot = orjson.loads(f.read())
+            id_to_market_data = {
+                coin_id: MarketData.model_validate(data)
+                for coin_id, data in snapshot["id_to_market_data"].items()
+            }
+            symbol_to_id = {
+                sys.intern(symbol): coin_id
+                for symbol, coin_id in snapshot["symbol_to_id"].items()
+            }
+            saved_at = float(snapshot.get("ts", 0.0))
+        except Exception as e:
+            logger.warning(
+                "[MarketDataCache] Ignoring unreadable snapshot '%s': %s", path, e
+            )
+            return None
+
+        self.symbol_to_id = symbol_to_id
+        self.id_to_market_data = id_to_market_data
+        self.symbol_to_market_data = self._build_market_data_view(
+            symbol_to_id, id_to_market_data
+        )
+        return saved_at
+
+    async def _save_snapshot(self) -> None:
+        """
+        Persists the cache to `snapshot_path`, replacing the previous file
+        atomically so a crash mid-write never leaves a truncated snapshot.
+        """
+        if not self.snapshot_path:
+            return
+        # serialize on the loop (fallback lookups may mutate the dicts),
+        # then hand only the file I/O to a thread
+        payload = orjson.dumps(
+            {
+                "ts": time.time(),
+                "symbol_to_id": self.symbol_to_id,
+                "id_to_market_data": {
+                    coin_id: market_data.model_dump(mode="json")
+                    for coin_id, market_data in self.id_to_market_data.items()
+                },
+            }
+        )
+        try:
+            await asyncio.to_thread(self._write_snapshot, self.snapshot_path, payload)
+        except OSError as e:
+            logger.warning(
+                "[MarketDataCache] Could not write snapshot '%s': %s",
+                self.snapshot_path,
+                e,
+            )
+
+    @staticmethod
+    def _write_snapshot(path: str, payload: bytes) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    async def aclose(self) -> None:
         """
-        await self._refresh_cache()
+        Cancels any background refreshes and closes the fetcher's HTTP client,
+        unless the fetcher was injected by the caller.
+        """
+        for task in (self._refresh_task, self._refresh_loop_task):
+            if task is not None and not task.done():
+                task.cancel()
+        if self._owns_fetcher:
+            await self._fetcher.aclose()
+
+    async def __aenter__(self) -> "MarketDataCache":
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def maybe_refresh(self):
         """
         Checks whether the cache is stale based on the TTL.
-        If expired or never initialized, triggers a refresh.
+
+        If the cache holds no data yet, the refresh is awaited with the
+        request-path retry budget, and concurrent callers join the same
+        in-flight refresh. Otherwise the current data keeps being served while
+        a single background task refreshes it (stale-while-revalidate).
+        """
+        if not self._is_stale():
+            return
+        if not self.symbol_to_id:
+            # Shield so one cancelled caller does not cancel the refresh for everyone
+            await asyncio.shield(self._start_refresh(REQUEST_PATH_ATTEMPTS))
+        else:
+            self._start_refresh()
+
+    def _is_stale(self) -> bool:
         """
-        if (
-            self._last_refreshed is None
-            or datetime.now() - self._last_refreshed
-            > timedelta(seconds=self.ttl_seconds)
-        ):
-            await self._refresh_cache()
+        Returns True if the cache was never refreshed or has outlived its TTL.
+        """
+        return time.monotonic() >= self._expires_at
 
-    async def _refresh_cache(self):
+    def _start_refresh(self, max_attempts: int = MAX_ATTEMPTS) -> asyncio.Task:
+        """
+        Returns the in-flight refresh task, starting one with `max_attempts`
+        if none is running. Callers that arrive mid-refresh join it rather
+        than starting another.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_cache(max_attempts))
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("[MarketDataCache] Refresh failed: %s", task.exception())
+
+    async def _refresh_cache(self, max_attempts: int = MAX_ATTEMPTS):
         """
         Fetches and caches the top N CoinGecko assets (e.g., top 750 by market cap).
 
@@ -233,27 +680,130 @@ class MarketDataCache(CoinGeckoBaseModel):
             - symbol_to_id: for resolving symbols to IDs
             - id_to_market_data: for enriched asset metadata
         """
-        print("[MarketDataCache] Refreshing cache...")
-        (symbol_to_id, id_to_market_data) = await self._fetcher.get_top_assets()
-        self.symbol_to_id = {**symbol_to_id}
-        self.id_to_market_data = {**id_to_market_data}
-        self._last_refreshed = datetime.now()
+        logger.info("[MarketDataCache] Refreshing cache...")
+        (symbol_to_id, id_to_market_data) = await self._fetcher.get_top_assets(
+            max_attempts
+        )
+        if not symbol_to_id:
+            # keep serving the current (possibly restored) data if the fetch failed
+            return
+        await self._refresh_fallbacks(symbol_to_id, id_to_market_data, max_attempts)
+        # the fetcher builds fresh dicts per call, so adopt them without copying;
+        # each attribute store is atomic, so readers see the old or new dict
+        self.symbol_to_id = symbol_to_id
+        self.id_to_market_data = id_to_market_data
+        self.symbol_to_market_data = self._build_market_data_view(
+            symbol_to_id, id_to_market_data
+        )
+        self._expires_at = time.monotonic() + self.ttl_seconds
+        await self._save_snapshot()
+
+    @staticmethod
+    def _build_market_data_view(
+        symbol_to_id: Dict[str, str], id_to_market_data: Dict[str, MarketData]
+    ) -> Dict[str, MarketData]:
+        """
+        Joins the symbol and market data maps into a symbol -> MarketData view.
+        """
+        return {
+            symbol: market_data
+            for symbol, coin_id in symbol_to_id.items()
+            if (market_data := id_to_market_data.get(coin_id)) is not None
+        }
+
+    async def _refresh_fallbacks(
+        self,
+        symbol_to_id: Dict[str, str],
+        id_to_market_data: Dict[str, MarketData],
+        max_attempts: int = MAX_ATTEMPTS,
+    ) -> None:
+        """
+        Re-fetches unexpired fallback-resolved symbols that the freshly fetched
+        mappings don't cover, with one batched request, and adds them.
+
+        Symbols that can't be re-fetched are dropped rather than carried over
+        with stale data; the next request resolves them through the fallback.
+        """
+        now = time.monotonic()
+        self._fallback_symbols = {
+            symbol: expires_at
+            for symbol, expires_at in self._fallback_symbols.items()
+            if expires_at > now
+        }
+        carried = [s for s in self._fallback_symbols if s not in symbol_to_id]
+        if not carried:
+            return
+
+        fetched = (
+            await self._fetcher.get_coin_market_data_by_symbol(carried, max_attempts)
+            or {}
+        )
+        for symbol in carried:
+            market_data = fetched.get(symbol)
+            if market_data is None:
+                del self._fallback_symbols[symbol]
+                continue
+            symbol_to_id[sys.intern(symbol)] = market_data.id
+            id_to_market_data.setdefault(market_data.id, market_data)
+
+    def _lookup_id(self, symbol: str) -> Optional[str]:
+        """
+        Resolves a symbol against the cache. Keys are stored lowercased, so
+        callers passing an already-lowercase symbol skip the `lower()` call.
+        """
+        coin_id = self.symbol_to_id.get(symbol)
+        if coin_id is None:
+            coin_id = self.symbol_to_id.get(symbol.lower())
+        return coin_id
 
     def get_id_from_symbol(self, symbol: str) -> Optional[str]:
         """
         Retrieves the CoinGecko ID for a given asset symbol.
 
         Args:
-            symbol (str): Asset symbol (e.g., 'btc', 'eth').
+            symbol (str): Asset symbol (e.g., 'btc', 'eth'). Lowercase symbols
+                take the fast path; other casings are normalized on a miss.
 
         Returns:
             Optional[str]: Corresponding CoinGecko ID if found; otherwise None.
         """
-        coin_id = self.symbol_to_id.get(symbol.lower())
+        coin_id = self._lookup_id(symbol)
         if not coin_id:
-            print(f"[SymbolCache] Warning: No CoinGecko ID found for symbol '{symbol}'")
+            logger.debug("[SymbolCache] No CoinGecko ID found for symbol '%s'", symbol)
         return coin_id
 
+    async def get_live_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Fetches current USD prices for the given symbols with one batched
+        `/simple/price` request.
+
+        Only the symbol -> ID mapping comes from the cache; the prices are
+        fetched live, since cached market data can be close to a TTL old.
+
+        Args:
+            symbols (List[str]): Asset symbols in any casing (e.g., ['BTC', 'ETH']).
+
+        Returns:
+            Dict[str, float]: Input symbol -> USD price for every symbol priced;
+            symbols that are not cached or not priced are omitted.
+        """
+        symbol_ids: Dict[str, str] = {}
+        for symbol in symbols:
+            market_data = self.symbol_to_market_data.get(symbol.lower())
+            if market_data is not None:
+                symbol_ids[symbol] = market_data.id
+        if not symbol_ids:
+            return {}
+
+        prices = await self._fetcher.get_simple_prices(set(symbol_ids.values()))
+        if prices is None:
+            return {}
+        return {
+            symbol: prices[coin_id]
+            for symbol, coin_id in symbol_ids.items()
+            if coin_id in prices
+        }
+
     async def get_asset_fallback(self, symbol: str) -> Optional[str]:
         """
         Attempts to fetch market data for an asset not in the top N list,
@@ -265,12 +815,110 @@ class MarketDataCache(CoinGeckoBaseModel):
         Returns:
             Optional[str]: CoinGecko ID if the fallback fetch succeeds; otherwise None.
         """
-        (asset_id, market_data) = await self._fetcher.get_coin_market_data_by_symbol(
-            list(symbol)
+        resolved = await self.get_assets_fallback([symbol])
+        return resolved.get(symbol.lower())
+
+    async def get_assets_fallback(self, symbols: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetches market data for several assets outside the top N list with a
+        single `/coins/markets?symbols=` request.
+
+        Symbols that already have a lookup in flight join that request instead
+        of being fetched again, and symbols recently reported as unknown are
+        answered from the negative cache without a request.
+
+        Args:
+            symbols (List[str]): Asset symbols to fetch (e.g., ['doge', 'shib']).
+
+        Returns:
+            Dict[str, Optional[str]]: Lowercase symbol → CoinGecko ID, or None if not found.
+        """
+        resolved: Dict[str, Optional[str]] = {}
+        now = time.monotonic()
+        wanted = []
+        for s in sorted({symbol.lower() for symbol in symbols}):
+            expires_at = self._negative.get(s)
+            if expires_at is not None and now < expires_at:
+                resolved[s] = None
+            else:
+                wanted.append(s)
+
+        tasks = {s: self._inflight[s] for s in wanted if s in self._inflight}
+        missing = [s for s in wanted if s not in tasks]
+        if missing:
+            task = asyncio.create_task(self._fetch_fallback(missing))
+            for s in missing:
+                self._inflight[s] = task
+                tasks[s] = task
+            task.add_done_callback(lambda t: self._release_inflight(missing, t))
+
+        for s, task in tasks.items():
+            # Shield so one cancelled caller does not cancel the lookup for everyone
+            results = await asyncio.shield(task)
+            resolved[s] = results.get(s)
+        return resolved
+
+    def _release_inflight(self, symbols: List[str], task: asyncio.Task) -> None:
+        for s in symbols:
+            if self._inflight.get(s) is task:
+                del self._inflight[s]
+
+    async def _fetch_fallback(self, symbols: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Performs one batched fallback lookup and caches every asset found.
+
+        Fallbacks run while a user request waits, so the lookup is not retried;
+        a failed lookup is simply tried again by the next request.
+        """
+        fetched = await self._fetcher.get_coin_market_data_by_symbol(
+            symbols, max_attempts=REQUEST_PATH_ATTEMPTS
         )
-        if asset_id is not None:
-            self.symbol_to_id[symbol] = asset_id
-            self.id_to_market_data[asset_id] = market_data
-            return asset_id
-        print(f"Could not fetch market data for asset with symbol '{symbol}'.")
-        return None
+        if fetched is None:
+            # the request itself failed; don't remember these symbols as unknown
+            return {symbol: None for symbol in symbols}
+
+        resolved: Dict[str, Optional[str]] = {}
+        for symbol in symbols:
+            market_data = fetched.get(symbol)
+            if market_data is None:
+                logger.warning(
+                    "Could not fetch market data for asset with symbol '%s'.", symbol
+                )
+                self._remember_unknown(symbol)
+                resolved[symbol] = None
+                continue
+            self._negative.pop(symbol, None)
+            self._remember_fallback(symbol)
+            symbol = sys.intern(symbol)
+            self.symbol_to_id[symbol] = market_data.id
+            self.id_to_market_data[market_data.id] = market_data
+            self.symbol_to_market_data[symbol] = market_data
+            resolved[symbol] = market_data.id
+        return resolved
+
+    def _remember_unknown(self, symbol: str) -> None:
+        """
+        Adds a symbol to the negative cache, evicting expired entries (then the
+        oldest ones) once the table reaches MAX_NEGATIVE_ENTRIES.
+        """
+        now = time.monotonic()
+        if len(self._negative) >= MAX_NEGATIVE_ENTRIES:
+            self._negative = {
+                s: expires_at
+                for s, expires_at in self._negative.items()
+                if expires_at > now
+            }
+            while len(self._negative) >= MAX_NEGATIVE_ENTRIES:
+                del self._negative[next(iter(self._negative))]
+        self._negative.pop(symbol, None)
+        self._negative[symbol] = now + NEGATIVE_TTL_SECONDS
+
+    def _remember_fallback(self, symbol: str) -> None:
+        """
+        Records a fallback-resolved symbol so full refreshes keep it, evicting
+        the oldest entries once the table reaches MAX_FALLBACK_ENTRIES.
+        """
+        self._fallback_symbols.pop(symbol, None)
+        while len(self._fallback_symbols) >= MAX_FALLBACK_ENTRIES:
+            del self._fallback_symbols[next(iter(self._fallback_symbols))]
+        self._fallback_symbols[symbol] = time.monotonic() + FALLBACK_TTL_SECONDS
@@ -1,27 +1,53 @@
+import asyncio
 import os
-from datetime import datetime, timedelta
+import time
 from typing import Dict, Optional
 
 import httpx  # type: ignore
+import orjson  # type: ignore
 
+import logging
+from utils.http_client import HTTPClientOwner
+from utils.refresh import refresh_ahead
 
-class FiatRateCache:
+logger = logging.getLogger(__name__)
+
+# Per-currency TTL multipliers for volatile currencies, which go stale well
+# before the rest of the table. Unlisted currencies use 1.0; values above 1.0
+# would have no effect, since the background task refreshes every rate at once.
+TTL_MULTIPLIERS = {
+    "try": 0.2,
+    "brl": 0.2,
+    "zar": 0.2,
+    "mxn": 0.2,
+}
+
+
+class FiatRateCache(HTTPClientOwner):
     """
     Caches fiat-to-USD exchange rates using Frankfurter.app.
     Used to convert fiat currency balances (e.g., JPY, EUR) to USD values
     for portfolio enrichment.
 
-    Rates are cached in memory and refreshed periodically based on TTL.
+    Rates are cached in memory and refreshed by a background task shortly
+    before the TTL expires, so lookups never wait on the network. Each rate
+    also has its own expiry scaled by TTL_MULTIPLIERS; looking up an expired
+    rate returns it as-is and schedules a background refresh.
     """
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(
+        self, ttl_seconds: int = 3600, client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initializes the cache instance.
 
         Args:
             ttl_seconds: Time-to-live for the cached exchange rates, in seconds.
                          After this duration, the cache will be refreshed automatically.
+            client: Optional shared HTTP client. If omitted, one is created on
+                first use and closed by `aclose()`.
         """
+        super().__init__(client)
         self.base_url = f"https://api.frankfurter.app"
         self.usd_rates_api = (
             "/latest?to=USD"  # Endpoint returns rates with USD as the target currency
@@ -29,15 +55,56 @@ class FiatRateCache:
         self.rates: Dict[str, float] = (
             {}
         )  # Maps lowercase currency symbols (e.g., 'eur') to float USD rates
-        self._last_refreshed: Optional[datetime] = None
+        self._expires_at = 0.0  # time.monotonic() deadline; 0.0 = never refreshed
+        # Per-symbol monotonic deadlines, scaled by currency volatility
+        self._rate_expires_at: Dict[str, float] = {}
+        # The in-flight refresh, shared by the background loop, `maybe_refresh`,
+        # and expired-rate lookups so only one Frankfurter request runs at a time
+        self._refresh_task: Optional[asyncio.Task] = None
         self.ttl_seconds = ttl_seconds
 
+        # Background task that refreshes rates ahead of expiry
+        self._refresh_loop_task: Optional[asyncio.Task] = None
+
     async def initialize(self) -> None:
         """
-        Loads exchange rates into the cache at startup.
+        Loads exchange rates into the cache at startup and starts the
+        background refresh task.
         Intended to be called once on application init.
         """
         await self._refresh_cache()
+        self._refresh_loop_task = asyncio.create_task(
+            refresh_ahead(
+                self.ttl_seconds, lambda: self._expires_at, self._start_refresh
+            )
+        )
+
+    def _start_refresh(self) -> asyncio.Task:
+        """
+        Returns the in-flight refresh task, starting one if none is running.
+
+        Concurrent callers join the same task, so a failing Frankfurter call
+        is made once and its error shared, rather than retried by each waiter.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_cache())
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("[FiatRateCache] Refresh failed: %s", task.exception())
+
+    async def aclose(self) -> None:
+        """
+        Cancels the background refreshes and closes the HTTP client if this
+        instance created it; a shared client is left for its owner to close.
+        """
+        for task in (self._refresh_loop_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+        await super().aclose()
 
     async def _refresh_cache(self) -> None:
         """
@@ -46,25 +113,38 @@ class FiatRateCache:
 
         Adds 'usd' manually to ensure consistent behavior for USD balances.
         """
-        async with httpx.AsyncClient() as client:
-            print("[FiatRateCache] Refreshing cache...")
-            resp = await client.get(self.base_url + self.usd_rates_api)
-            data = resp.json()
-            self.rates = {k.lower(): float(v) for k, v in data["rates"].items()}
-            self.rates["usd"] = 1.0  # Ensure USD is handled
-            self._last_refreshed = datetime.now()
+        client = self._get_client()
+        logger.info("[FiatRateCache] Refreshing cache...")
+        resp = await client.get(self.base_url + self.usd_rates_api)
+        data = orjson.loads(resp.content)
+        rates = {k.lower(): float(v) for k, v in data["rates"].items()}
+        rates["usd"] = 1.0  # Ensure USD is handled
+
+        now = time.monotonic()
+        self._rate_expires_at = {
+            symbol: now + self.ttl_seconds * TTL_MULTIPLIERS.get(symbol, 1.0)
+            for symbol in rates
+        }
+        self.rates = rates
+        self._expires_at = now + self.ttl_seconds
 
     async def maybe_refresh(self) -> None:
         """
         Checks if the cache has expired based on the TTL.
         If so, triggers a refresh.
+
+        The background task normally refreshes first; this is a fallback for
+        when it has fallen behind (e.g., Frankfurter was unreachable). Stale
+        rates keep being served while a background refresh runs; callers only
+        wait when there are no rates at all.
         """
-        if (
-            self._last_refreshed is None
-            or datetime.now() - self._last_refreshed
-            > timedelta(seconds=self.ttl_seconds)
-        ):
-            await self._refresh_cache()
+        if time.monotonic() < self._expires_at:
+            return
+        if self.rates:
+            self._start_refresh()
+            return
+        # Shield so one cancelled caller does not cancel the refresh for everyone
+        await asyncio.shield(self._start_refresh())
 
     def get_rate(self, symbol: str) -> Optional[float]:
         """
@@ -74,6 +154,24 @@ class FiatRateCache:
             symbol: The fiat currency symbol (e.g., "eur", "jpy", "usd").
 
         Returns:
-            The USD conversion rate, or None if not found.
+            The USD conversion rate, or None if not found. A rate past its
+            per-symbol expiry is still returned while a refresh runs in the
+            background.
         """
-        return self.rates.get(symbol.lower())
+        symbol = symbol.lower()
+        rate = self.rates.get(symbol)
+        if rate is not None and time.monotonic() >= self._rate_expires_at[symbol]:
+            self._schedule_refresh(symbol)
+        return rate
+
+    def _schedule_refresh(self, symbol: str) -> None:
+        """
+        Starts a background refresh unless one is already running.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        logger.info(
+            "[FiatRateCache] Rate for '%s' expired; serving stale value while refreshing",
+            symbol,
+        )
+        self._start_refresh()
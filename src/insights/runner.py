@@ -10,11 +10,9 @@ INSIGHT_PLUGINS = [
     # Add more insights here later
 ]
 
+# Bound `run` methods, resolved once at import rather than per request
+_RUNNERS = tuple(plugin.run for plugin in INSIGHT_PLUGINS)
+
 
 def generate_insights(assets: List[CryptoAsset | FiatAsset]) -> List[InsightResult]:
-    results = []
-    for plugin in INSIGHT_PLUGINS:
-        result = plugin.run(assets)
-        if result:
-            results.append(result)
-    return results
+    return [result for result in (run(assets) for run in _RUNNERS) if result]
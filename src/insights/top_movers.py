@@ -1,9 +1,16 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np  # type: ignore
 
 from models.portfolio_assets import CryptoAsset, FiatAsset  # adjust path if needed
 
 from .base import Insight, InsightResult
 
+# Number of best/worst performers reported, with their metadata labels built once
+TOP_N = 3
+BEST_LABELS = tuple(f"Best Performer {i}" for i in range(1, TOP_N + 1))
+WORST_LABELS = tuple(f"Worst Performer {i}" for i in range(1, TOP_N + 1))
+
 
 class TopMoversInsight(Insight):
     def run(self, assets: List[CryptoAsset | FiatAsset]) -> Optional[InsightResult]:
@@ -15,23 +22,22 @@ class TopMoversInsight(Insight):
         if not assets_with_change:
             return None  # No applicable insight
 
-        best_performers = self._get_top_n(
-            assets_with_change, key="price_change_percentage_24h", reverse=True
-        )
-        worst_performers = self._get_top_n(
-            assets_with_change, key="price_change_percentage_24h", reverse=False
+        best_performers, worst_performers = self._get_extremes(
+            assets_with_change, key="price_change_percentage_24h", n=TOP_N
         )
 
         metadata = {}
 
-        for i, asset in enumerate(best_performers, 1):
-            metadata[f"Best Performer {i}"] = (
-                f"{asset.symbol} (+{asset.price_change_percentage_24h:.2f}%)"
+        for label, asset in zip(BEST_LABELS, best_performers):
+            metadata[label] = "%s (+%.2f%%)" % (
+                asset.symbol,
+                asset.price_change_percentage_24h,
             )
 
-        for i, asset in enumerate(worst_performers, 1):
-            metadata[f"Worst Performer {i}"] = (
-                f"{asset.symbol} ({asset.price_change_percentage_24h:.2f}%)"
+        for label, asset in zip(WORST_LABELS, worst_performers):
+            metadata[label] = "%s (%.2f%%)" % (
+                asset.symbol,
+                asset.price_change_percentage_24h,
             )
 
         return InsightResult(
@@ -41,7 +47,27 @@ class TopMoversInsight(Insight):
             tags=["volatility", "momentum"],
         )
 
-    def _get_top_n(
-        self, assets: List[CryptoAsset | FiatAsset], key: str, reverse: bool, n: int = 3
-    ) -> List[CryptoAsset | FiatAsset]:
-        return sorted(assets, key=lambda a: getattr(a, key, 0), reverse=reverse)[:n]
+    def _get_extremes(
+        self, assets: List[CryptoAsset | FiatAsset], key: str, n: int = 3
+    ) -> Tuple[List[CryptoAsset | FiatAsset], List[CryptoAsset | FiatAsset]]:
+        # Partial selection: everything at or beyond the k-th value is a
+        # candidate, and only those few candidates are stable-sorted, so tied
+        # assets keep portfolio order at both ends
+        values = np.fromiter(
+            (getattr(a, key, 0) for a in assets), dtype=np.float64, count=len(assets)
+        )
+        k = min(n, len(values))
+        best_idx = self._select(-values, k)
+        worst_idx = self._select(values, k)
+        return [assets[i] for i in best_idx], [assets[i] for i in worst_idx]
+
+    @staticmethod
+    def _select(order: np.ndarray, k: int) -> np.ndarray:
+        """
+        Returns the indices of the k smallest entries of `order`, ascending,
+        with ties broken by position.
+        """
+        kth = np.partition(order, k - 1)[k - 1]
+        candidates = np.flatnonzero(order <= kth)
+        ranked = np.argsort(order[candidates], kind="stable")
+        return candidates[ranked[:k]]
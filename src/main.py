@@ -1,11 +1,33 @@
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv  # type: ignore
 from fastapi import FastAPI  # type: ignore
 
+import logging
 from api.routes import router
+from deps.caches import close_clients, get_fiat_rate_cache, get_market_data_cache
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-app = FastAPI(title="Midas API", version="0.1")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the market and fiat caches before the server accepts traffic
+    await get_market_data_cache()
+    # A Frankfurter outage must not block startup; the lazy getter retries
+    # on the next request, and portfolios skip fiat until it recovers
+    try:
+        await get_fiat_rate_cache()
+    except Exception as e:
+        logger.warning("Fiat rate warm-up failed; will retry on demand: %s", e)
+    yield
+    # Release pooled HTTP connections on shutdown
+    await close_clients()
+
+
+app = FastAPI(title="Midas API", version="0.1", lifespan=lifespan)
 
 app.include_router(router)
 
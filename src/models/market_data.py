@@ -1,10 +1,13 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, HttpUrl  # type: ignore
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, HttpUrl  # type: ignore
 
 
 class MarketData(BaseModel):
+    # Cached market data is read-only; frozen instances are also hashable.
+    model_config = ConfigDict(frozen=True)
+
     id: Optional[str]
     symbol: Optional[str]
     name: Optional[str]
@@ -31,9 +34,35 @@ class MarketData(BaseModel):
     atl_date: Optional[datetime]
     last_updated: Optional[datetime]
 
-    # Change keys that end in `_in_currency` to cleaner names
-    price_change_percentage_7d: Optional[float]
-    price_change_percentage_14d: Optional[float]
-    price_change_percentage_30d: Optional[float]
-    price_change_percentage_200d: Optional[float]
-    price_change_percentage_1y: Optional[float]
+    # CoinGecko returns these as `..._in_currency`; the aliases rename them
+    # during parsing, while the clean names are still accepted (e.g., snapshots)
+    price_change_percentage_7d: Optional[float] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "price_change_percentage_7d_in_currency", "price_change_percentage_7d"
+        ),
+    )
+    price_change_percentage_14d: Optional[float] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "price_change_percentage_14d_in_currency", "price_change_percentage_14d"
+        ),
+    )
+    price_change_percentage_30d: Optional[float] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "price_change_percentage_30d_in_currency", "price_change_percentage_30d"
+        ),
+    )
+    price_change_percentage_200d: Optional[float] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "price_change_percentage_200d_in_currency", "price_change_percentage_200d"
+        ),
+    )
+    price_change_percentage_1y: Optional[float] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "price_change_percentage_1y_in_currency", "price_change_percentage_1y"
+        ),
+    )
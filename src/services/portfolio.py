@@ -1,15 +1,77 @@
-from typing import Dict, List
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
-from deps.caches import get_fiat_rate_cache, get_market_data_cache
-from fetchers.coinbase import CoinbaseRequestHandler
+import logging
+from deps.caches import (
+    get_coinbase_handler,
+    get_fiat_rate_cache,
+    get_market_data_cache,
+)
 from fetchers.coingecko import MarketDataCache
 from fetchers.frankfurter import FiatRateCache
+from models.market_data import MarketData
 from models.portfolio_assets import CryptoAsset, FiatAsset
-from utils.portfolio_helpers import (
-    enrich_crypto_asset,
-    enrich_fiat_asset,
-    resolve_cg_id,
-)
+from utils.portfolio_helpers import enrich_crypto_asset, enrich_fiat_assets
+
+logger = logging.getLogger(__name__)
+
+
+class PortfolioCoalescer:
+    """
+    Collapses concurrent upstream portfolio fetches into a single call.
+
+    While a fetch is in flight, later callers await the same task instead of
+    starting their own, and every caller receives its result (or exception).
+    """
+
+    def __init__(self):
+        self._inflight: Optional[asyncio.Task] = None
+
+    async def fetch(self, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs `loader`, or joins the fetch that is already in flight.
+
+        Args:
+            loader: A zero-argument coroutine function performing the upstream fetch.
+
+        Returns:
+            The result of the shared fetch.
+        """
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(loader())
+            self._inflight.add_done_callback(self._clear)
+        # Shield so one cancelled caller does not cancel the fetch for everyone
+        return await asyncio.shield(self._inflight)
+
+    def _clear(self, task: asyncio.Task) -> None:
+        if self._inflight is task:
+            self._inflight = None
+
+
+_holdings_coalescer = PortfolioCoalescer()
+
+
+async def _fetch_raw_holdings(market_cache: MarketDataCache) -> List[Dict]:
+    """
+    Fetches raw Coinbase holdings, sharing one upstream call between
+    concurrent requests. The returned records must not be mutated.
+
+    Holdings are priced with one live CoinGecko `/simple/price` request for
+    every cached symbol; only the rest go to the Coinbase spot endpoint.
+    """
+    handler = await get_coinbase_handler()
+    return await _holdings_coalescer.fetch(
+        lambda: handler.get_holdings(market_cache.get_live_prices)
+    )
 
 
 async def get_portfolio() -> List[CryptoAsset]:
@@ -23,15 +85,88 @@ async def get_portfolio() -> List[CryptoAsset]:
     Returns:
         A list of enriched CryptoAsset and FiatAsset objects.
     """
-    fiat_rate_cache = await get_fiat_rate_cache()
+    return await enrich_holdings(*await load_portfolio_sources())
+
+
+async def load_portfolio_sources() -> (
+    Tuple[Optional[FiatRateCache], MarketDataCache, List[Dict]]
+):
+    """
+    Loads everything portfolio enrichment needs: the fiat and market caches
+    and the raw Coinbase holdings.
+
+    Streaming callers await this before sending a response, so a Coinbase or
+    market-cache failure surfaces as an error instead of an empty stream.
+
+    Returns:
+        The fiat rate cache (None if unavailable), the market data cache,
+        and the raw holdings.
+    """
+    # Holdings are priced from the market cache, so they are fetched after it;
+    # the fiat cache has no such dependency and loads alongside both.
+    fiat_rate_cache, (market_data_cache, holdings) = await asyncio.gather(
+        _get_fiat_rate_cache_or_none(), _get_market_cache_and_holdings()
+    )
+    return fiat_rate_cache, market_data_cache, holdings
+
+
+async def _get_fiat_rate_cache_or_none() -> Optional[FiatRateCache]:
+    """
+    Loads the fiat rate cache, returning None on failure so a Frankfurter
+    outage drops fiat balances instead of failing the whole portfolio.
+    """
+    try:
+        return await get_fiat_rate_cache()
+    except Exception as e:
+        logger.warning("Fiat rates unavailable; skipping fiat assets: %s", e)
+        return None
+
+
+async def _get_market_cache_and_holdings() -> Tuple[MarketDataCache, List[Dict]]:
+    """
+    Loads the market cache and then the raw holdings priced from it.
+    """
+    market_data_cache = await get_market_data_cache()
+    holdings = await _fetch_raw_holdings(market_data_cache)
+    return market_data_cache, holdings
+
+
+async def get_crypto_holdings() -> List[CryptoAsset]:
+    """
+    Fetches the user's portfolio and enriches only the crypto assets.
+
+    Fiat balances are skipped before enrichment, so callers that only need
+    crypto (e.g., insights) avoid both fiat conversion and a second filtering
+    pass over the results.
+
+    Returns:
+        A list of enriched CryptoAsset objects.
+    """
+    market_data_cache = await get_market_data_cache()
+    holdings = await _fetch_raw_holdings(market_data_cache)
+    return await enrich_holdings(None, market_data_cache, holdings)
+
+
+async def get_staked_holdings() -> List[CryptoAsset]:
+    """
+    Fetches only the user's staked assets, enriched with market metadata.
+
+    Staking status is already known on the raw Coinbase records, so unstaked
+    holdings are dropped before any enrichment work is done.
+
+    Returns:
+        A list of enriched, staked CryptoAsset objects.
+    """
     market_data_cache = await get_market_data_cache()
-    handler = CoinbaseRequestHandler()
-    holdings = await handler.get_holdings()
-    return await enrich_holdings(fiat_rate_cache, market_data_cache, holdings)
+    holdings = await _fetch_raw_holdings(market_data_cache)
+    staked = [asset for asset in holdings if asset["is_staked"]]
+    return await enrich_holdings(None, market_data_cache, staked)
 
 
 async def enrich_holdings(
-    fiat_cache: FiatRateCache, market_cache: MarketDataCache, raw_assets: List[Dict]
+    fiat_cache: Optional[FiatRateCache],
+    market_cache: MarketDataCache,
+    raw_assets: List[Dict],
 ) -> List[CryptoAsset | FiatAsset]:
     """
     Enriches raw Coinbase asset records with external metadata.
@@ -41,7 +176,8 @@ async def enrich_holdings(
     - Enriching fiat assets with USD conversion rates
 
     Args:
-        fiat_cache: A FiatRateCache instance used to convert fiat balances to USD.
+        fiat_cache: A FiatRateCache instance used to convert fiat balances to USD,
+            or None to drop fiat assets from the result.
         market_cache: A MarketDataCache instance used to resolve CoinGecko IDs and market data.
         raw_assets: A list of raw asset dictionaries returned by the Coinbase API.
 
@@ -49,19 +185,126 @@ async def enrich_holdings(
         A list of enriched CryptoAsset and FiatAsset instances.
     """
 
-    enriched_assets = []
-    for asset in raw_assets:
-        symbol = asset["symbol"].lower()
-        cg_id = await resolve_cg_id(market_cache, symbol)
+    rows = [(asset, asset["symbol"].lower()) for asset in raw_assets]
+    market_data = _lookup_market_data(market_cache, rows)
+    await _resolve_fallbacks(market_cache, market_data)
 
-        if cg_id is None:
-            fiat = enrich_fiat_asset(asset, fiat_cache)
-            if fiat:
-                enriched_assets.append(fiat)
+    enriched_assets = _enrich_rows(fiat_cache, market_data, rows)
+    return [asset for asset in enriched_assets if asset is not None]
+
+
+async def stream_holdings(
+    fiat_cache: Optional[FiatRateCache],
+    market_cache: MarketDataCache,
+    raw_assets: List[Dict],
+) -> AsyncIterator[CryptoAsset | FiatAsset]:
+    """
+    Streaming variant of `enrich_holdings`.
+
+    Assets already in the market cache are yielded before the fallback lookup
+    starts, so a slow or throttled CoinGecko call only delays the assets that
+    need it. Fallback-resolved crypto and fiat assets follow.
+
+    Args:
+        fiat_cache: A FiatRateCache instance used to convert fiat balances to USD,
+            or None to drop fiat assets from the result.
+        market_cache: A MarketDataCache instance used to resolve CoinGecko IDs and market data.
+        raw_assets: A list of raw asset dictionaries returned by the Coinbase API.
+
+    Yields:
+        Enriched CryptoAsset and FiatAsset instances.
+    """
+    rows = [(asset, asset["symbol"].lower()) for asset in raw_assets]
+    market_data = _lookup_market_data(market_cache, rows)
+
+    cached = [row for row in rows if market_data[row[1]] is not None]
+    pending = [row for row in rows if market_data[row[1]] is None]
+    for enriched in _enrich_rows(fiat_cache, market_data, cached):
+        if enriched is not None:
+            yield enriched
+
+    if not pending:
+        return
+
+    await _resolve_fallbacks(market_cache, market_data)
+    for enriched in _enrich_rows(fiat_cache, market_data, pending):
+        if enriched is not None:
+            yield enriched
+
+
+def _lookup_market_data(
+    market_cache: MarketDataCache, rows: List[Tuple[Dict, str]]
+) -> Dict[str, Optional[MarketData]]:
+    """
+    Resolves each row's lowercased symbol straight to its cached market data;
+    the dict also dedupes repeats (e.g., staked + unstaked ETH).
+    """
+    return {
+        symbol: market_cache.symbol_to_market_data.get(symbol) for _, symbol in rows
+    }
+
+
+def _enrich_rows(
+    fiat_cache: Optional[FiatRateCache],
+    market_data: Dict[str, Optional[MarketData]],
+    rows: List[Tuple[Dict, str]],
+) -> List[Optional[CryptoAsset | FiatAsset]]:
+    """
+    Enriches (raw asset, lowercased symbol) rows whose market data has been
+    resolved: crypto rows are merged with their market data, and the rest are
+    converted as fiat (or dropped if `fiat_cache` is None).
+
+    Returns:
+        One entry per row, in order; None for rows that were skipped or failed.
+    """
+    # One slot per row, written by index; fiat rows are converted together
+    # after the loop and skipped or failed rows stay None
+    enriched_assets: List[Optional[CryptoAsset | FiatAsset]] = [None] * len(rows)
+    fiat_slots: List[int] = []
+    fiat_rows: List[Dict] = []
+    fiat_symbols: List[str] = []
+    for i, (asset, symbol) in enumerate(rows):
+        md = market_data[symbol]
+
+        if md is None:
+            if fiat_cache is not None:
+                fiat_slots.append(i)
+                fiat_rows.append(asset)
+                fiat_symbols.append(symbol)
             continue
 
-        crypto = enrich_crypto_asset(asset, cg_id, market_cache)
-        if crypto:
-            enriched_assets.append(crypto)
+        enriched_assets[i] = enrich_crypto_asset(asset, md)
+
+    if fiat_rows:
+        fiat_assets = enrich_fiat_assets(fiat_rows, fiat_cache, fiat_symbols)
+        for slot, fiat in zip(fiat_slots, fiat_assets):
+            enriched_assets[slot] = fiat
 
     return enriched_assets
+
+
+async def _resolve_fallbacks(
+    market_cache: MarketDataCache, market_data: Dict[str, Optional[MarketData]]
+) -> None:
+    """
+    Fills in cache misses in `market_data` with one batched fallback lookup.
+    Resolved symbols are added to the cache, so later requests hit it directly.
+    """
+    missing = [symbol for symbol, md in market_data.items() if md is None]
+    if not missing:
+        return
+
+    logger.info(
+        "Assets not in the top %d: %s. Trying fallback lookup.",
+        market_cache.top_n,
+        ", ".join(missing),
+    )
+    try:
+        await market_cache.get_assets_fallback(missing)
+    except Exception as e:
+        logger.warning("Fallback lookup for %s failed: %s", ", ".join(missing), e)
+    for symbol in missing:
+        market_data[symbol] = market_cache.symbol_to_market_data.get(symbol)
+    unresolved = [symbol for symbol in missing if market_data[symbol] is None]
+    if unresolved:
+        logger.info("No CoinGecko ID found for: %s", ", ".join(unresolved))
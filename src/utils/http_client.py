@@ -0,0 +1,63 @@
+from typing import Optional
+
+import httpx  # type: ignore
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Builds the pooled HTTP/2 client used for outbound API calls.
+
+    A single client is shared process-wide (see `deps.caches.get_http_client`)
+    so Coinbase, CoinGecko and Frankfurter requests reuse open TLS connections.
+    Fetchers constructed without a shared client fall back to their own instance.
+
+    Returns:
+        A new httpx.AsyncClient; the caller is responsible for closing it.
+    """
+    # Idle connections are kept for 75s, matching the nginx/Cloudflare
+    # keep-alive default in front of CoinGecko and Frankfurter
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        headers={"accept": "application/json"},
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=75.0
+        ),
+    )
+
+
+class HTTPClientOwner:
+    """
+    Mixin for API clients that use either an injected HTTP client or one they
+    create on first use.
+
+    An injected client is shared with other callers and left for its owner to
+    close; a lazily created one belongs to this instance and is closed by
+    `aclose()`.
+    """
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: Optional shared HTTP client. If omitted, one is created on
+                first use and closed by `aclose()`.
+        """
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Returns the long-lived HTTP client, creating it on first use.
+        """
+        if self._client is None:
+            self._client = create_http_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP client if this instance created it.
+        Intended to be called once on application shutdown.
+        """
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
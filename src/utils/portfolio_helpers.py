@@ -1,63 +1,40 @@
-from typing import Optional
+from typing import List, Optional
 
-from fetchers.coingecko import MarketDataCache
+import numpy as np  # type: ignore
+
+import logging
 from fetchers.frankfurter import FiatRateCache
+from models.market_data import MarketData
 from models.portfolio_assets import CryptoAsset, FiatAsset
 
+logger = logging.getLogger(__name__)
 
-async def resolve_cg_id(cache: MarketDataCache, symbol: str) -> Optional[str]:
-    """
-    Resolves the CoinGecko ID for a given asset symbol, using both the top-N cache
-    and a fallback API call for less common or newly listed assets.
-
-    Args:
-        cache: The MarketDataCache instance with top asset mappings and fallback support.
-        symbol: The asset symbol to resolve (e.g., 'sol', 'doge').
-
-    Returns:
-        The corresponding CoinGecko ID if found, or None if resolution fails.
-    """
-    cg_id = cache.get_id_from_symbol(symbol)
-    if cg_id is not None:
-        return cg_id
-
-    print(
-        f"Asset with symbol '{symbol}' not in the top {cache.page_limit * cache.num_pages} assets. Trying fallback lookup."
-    )
-    fallback_id = await cache.get_asset_fallback(symbol)
-    if not fallback_id:
-        print(f"No fallback CoinGecko ID found for symbol: {symbol}")
-        return None
-
-    return fallback_id
+# Below this many fiat rows, per-row conversion beats building numpy arrays
+FIAT_VECTORIZE_THRESHOLD = 16
 
 
-def enrich_crypto_asset(
-    asset: dict, cg_id: str, market_cache: MarketDataCache
-) -> Optional[CryptoAsset]:
+def enrich_crypto_asset(asset: dict, asset_md: MarketData) -> Optional[CryptoAsset]:
     """
     Merges raw Coinbase asset data with CoinGecko market data to produce a CryptoAsset.
     """
     try:
-        asset_md = market_cache.id_to_market_data[cg_id]
-        asset_md_dict = asset_md.dict()
-        merged = dict(asset)
+        # Coinbase values win; market data fills in every field not already set.
+        # CoinGecko's `_in_currency` names are renamed at parse time, so the
+        # model's __dict__ already has the final keys and merges in one step.
+        merged = {**asset_md.__dict__, **asset}
 
-        for k, v in asset_md_dict.items():
-            cleaned_key = (
-                k.replace("_in_currency", "") if k.endswith("_in_currency") else k
-            )
-            if cleaned_key not in merged:
-                merged[cleaned_key] = v
-
-        return CryptoAsset(**merged)
+        # Both sources are already validated (Coinbase records are built by the
+        # handler, market data by the cache), so skip re-validation here
+        return CryptoAsset.model_construct(**merged)
 
     except Exception as e:
-        print(f"Failed to enrich crypto asset '{asset.get('symbol')}': {e}")
+        logger.warning("Failed to enrich crypto asset '%s': %s", asset.get("symbol"), e)
         return None
 
 
-def enrich_fiat_asset(asset: dict, fiat_cache: FiatRateCache) -> Optional[FiatAsset]:
+def enrich_fiat_asset(
+    asset: dict, fiat_cache: FiatRateCache, symbol: Optional[str] = None
+) -> Optional[FiatAsset]:
     """
     Converts a fiat currency balance from Coinbase into a FiatAsset object
     by applying the cached USD conversion rate.
@@ -65,21 +42,86 @@ def enrich_fiat_asset(asset: dict, fiat_cache: FiatRateCache) -> Optional[FiatAs
     Args:
         asset: A single raw Coinbase asset dictionary (must be fiat).
         fiat_cache: The FiatRateCache instance for USD conversion rates.
+        symbol: The asset's lowercased symbol, if the caller already has it.
 
     Returns:
         A FiatAsset object enriched with USD value, or None if the rate is missing.
     """
-    symbol = asset["symbol"].lower()
+    if symbol is None:
+        symbol = asset["symbol"].lower()
     rate = fiat_cache.get_rate(symbol)
     if rate is None:
-        print(f"No USD conversion rate for {symbol}. Skipping.")
+        logger.info("No USD conversion rate for %s. Skipping.", symbol)
         return None
 
     balance = asset.get("balance", 0.0)
-    return FiatAsset(
+    return _build_fiat_asset(asset, symbol, balance * rate)
+
+
+def _build_fiat_asset(asset: dict, symbol: str, usd_value: float) -> FiatAsset:
+    """
+    Builds a FiatAsset from a Coinbase record without re-validating it; the
+    handler already parsed the balance to a float.
+    """
+    return FiatAsset.model_construct(
         id=asset.get("id"),
         symbol=symbol,
         name=asset.get("name", symbol.upper()),
-        balance=balance,
-        usd_value=balance * rate,
+        balance=asset.get("balance", 0.0),
+        usd_value=usd_value,
+    )
+
+
+def enrich_fiat_assets(
+    assets: List[dict],
+    fiat_cache: FiatRateCache,
+    symbols: Optional[List[str]] = None,
+) -> List[Optional[FiatAsset]]:
+    """
+    Converts several fiat balances at once; see `enrich_fiat_asset`.
+
+    With at least FIAT_VECTORIZE_THRESHOLD rows, all USD values are computed
+    in one numpy multiply over aligned balance and rate arrays.
+
+    Args:
+        assets: Raw Coinbase asset dictionaries (must be fiat).
+        fiat_cache: The FiatRateCache instance for USD conversion rates.
+        symbols: The assets' lowercased symbols, if the caller already has them.
+
+    Returns:
+        One entry per input asset: a FiatAsset, or None if its rate is missing.
+    """
+    if symbols is None:
+        symbols = [asset["symbol"].lower() for asset in assets]
+
+    if len(assets) < FIAT_VECTORIZE_THRESHOLD:
+        return [
+            enrich_fiat_asset(asset, fiat_cache, symbol)
+            for asset, symbol in zip(assets, symbols)
+        ]
+
+    rates = np.fromiter(
+        (
+            np.nan if (rate := fiat_cache.get_rate(symbol)) is None else rate
+            for symbol in symbols
+        ),
+        dtype=np.float64,
+        count=len(symbols),
+    )
+    balances = np.fromiter(
+        (asset.get("balance", 0.0) for asset in assets),
+        dtype=np.float64,
+        count=len(assets),
     )
+    usd_values = balances * rates
+
+    results: List[Optional[FiatAsset]] = []
+    for asset, symbol, missing, usd_value in zip(
+        assets, symbols, np.isnan(rates).tolist(), usd_values.tolist()
+    ):
+        if missing:
+            logger.info("No USD conversion rate for %s. Skipping.", symbol)
+            results.append(None)
+            continue
+        results.append(_build_fiat_asset(asset, symbol, usd_value))
+    return results
@@ -0,0 +1,42 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+# Background refreshes run this fraction of the TTL before expiry, and never
+# more often than MIN_REFRESH_INTERVAL_SECONDS (e.g., after a failed refresh)
+REFRESH_AHEAD_FRACTION = 0.1
+MIN_REFRESH_INTERVAL_SECONDS = 30.0
+
+
+async def refresh_ahead(
+    ttl_seconds: float,
+    expires_at: Callable[[], float],
+    start_refresh: Callable[[], Awaitable[None]],
+) -> None:
+    """
+    Runs forever, refreshing a cache shortly before each expiry so request
+    handlers never wait on the upstream API.
+
+    A failed refresh leaves the deadline in the past, so it is retried after
+    MIN_REFRESH_INTERVAL_SECONDS.
+
+    Args:
+        ttl_seconds: The cache TTL; the refresh starts REFRESH_AHEAD_FRACTION of
+            it before expiry.
+        expires_at: Returns the cache's current monotonic expiry deadline.
+        start_refresh: Returns the cache's in-flight refresh task, starting one
+            if none is running. The cache is expected to log its own failures.
+    """
+    lead = ttl_seconds * REFRESH_AHEAD_FRACTION
+    while True:
+        delay = expires_at() - lead - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+            continue
+        try:
+            # Shield so cancelling the loop does not cancel a refresh that
+            # request handlers may be waiting on
+            await asyncio.shield(start_refresh())
+        except Exception:
+            pass
+        await asyncio.sleep(MIN_REFRESH_INTERVAL_SECONDS)